@@ -1,6 +1,65 @@
 import hashlib  # Module for creating secure hash functions
 import time     # Module for time operations
 import json     # Module for JSON data handling
+import os       # Module for CPU count
+import logging  # Module for optional mining messages
+from concurrent.futures import ProcessPoolExecutor  # Module for parallel mining
+
+try:
+    import orjson   # Faster JSON encoder, used when it is installed
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+MINING_BATCH_SIZE = 5000                # Nonces tested per batch while mining
+PARALLEL_MINING_MIN_DIFFICULTY = 5      # Easier blocks are mined in one process
+
+
+def canonical_json(content):
+    # Serializes content with sorted keys and no extra whitespace
+    # orjson and the json fallback give the same bytes for all valid text,
+    # so hashes do not depend on whether orjson is installed. orjson rejects
+    # lone surrogates (which input() can return), so such content goes
+    # through json; surrogatepass writes them as bytes that valid UTF-8
+    # never produces, so they cannot collide with real text.
+    if orjson is not None:
+        try:
+            return orjson.dumps(content, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(content, sort_keys=True, separators=(",", ":"),
+                      ensure_ascii=False).encode('utf-8', 'surrogatepass')
+
+
+def is_raw_hash(value):
+    # True for a well-formed hash field: exactly 32 raw digest bytes
+    return type(value) is bytes and len(value) == 32
+
+
+def search_nonce_batch(prefix_state, suffix, start_nonce, batch_size, target, stride=1):
+    """
+    Tests batch_size nonces start_nonce, start_nonce + stride, ... in one tight loop.
+    A hash meets the target when its digest, read as a 256-bit number,
+    is below target.
+    Returns (nonce, digest) for the first winning nonce, or None.
+    """
+    # Look up the methods once so each attempt is just the hashing calls
+    copy_state = prefix_state.copy
+    for nonce in range(start_nonce, start_nonce + batch_size * stride, stride):
+        attempt = copy_state()
+        attempt.update(b"%d%s" % (nonce, suffix))
+        digest = attempt.digest()
+        if int.from_bytes(digest, 'big') < target:
+            return nonce, digest
+    return None
+
+
+def search_nonce_worker(prefix, suffix, start_nonce, batch_size, target, stride):
+    # Worker for parallel mining: hash objects cannot be sent to another
+    # process, so each worker rebuilds the prefix midstate itself
+    return search_nonce_batch(hashlib.sha256(prefix), suffix, start_nonce,
+                              batch_size, target, stride)
 
 # Block Definition
 class CryptoBlock:
@@ -8,27 +67,51 @@ class CryptoBlock:
     A single block in the blockchain.
     Each block contains data and links to the previous block.
     """
+    # Fixed set of fields: no per-block __dict__, smaller and faster blocks
+    __slots__ = ("block_id", "prev_block_hash", "created_time", "block_data",
+                 "nonce", "current_hash")
+
     def __init__(self, block_id, prev_block_hash, created_time, block_data, nonce):
         self.block_id = block_id                    # Position of block in the chain
-        self.prev_block_hash = prev_block_hash      # Hash of the previous block
-        self.created_time = created_time            # When the block was created
+        self.prev_block_hash = prev_block_hash      # Raw hash bytes of the previous block
+        self.created_time = created_time            # Creation time in nanoseconds since the epoch
         self.block_data = block_data                # Data stored in this block
         self.nonce = nonce                          # Number used for mining
-        self.current_hash = self.generate_hash()    # Hash of this block
+        self.current_hash = self.generate_hash()    # Raw hash bytes of this block
 
-    def generate_hash(self):
-        # Creates a unique hash for this block
-        # All block information is combined to make the hash
+    def generate_content(self):
+        # Combines all block information into one canonical byte string
         block_content = {
             "id": self.block_id,
-            "prev_hash": self.prev_block_hash,
+            "prev_hash": self.prev_block_hash.hex(),
             "timestamp": self.created_time,
             "data": self.block_data,
             "nonce": self.nonce
         }
-        # Convert to string and create hash
-        content_string = json.dumps(block_content, sort_keys=True)
-        return hashlib.sha256(content_string.encode('utf-8')).hexdigest()
+        return canonical_json(block_content)
+
+    def prepare_mining_template(self):
+        """
+        Serializes the block once and splits it around the nonce value.
+        Returns (prefix, suffix) bytes so that prefix + nonce digits + suffix
+        is exactly what generate_hash() would hash for that nonce.
+        """
+        # Keys are sorted, so everything after the nonce is prev_hash and
+        # timestamp, which can never contain the placeholder itself
+        placeholder = "__NONCE__"
+        saved_nonce = self.nonce
+        self.nonce = placeholder
+        try:
+            template = self.generate_content()
+        finally:
+            self.nonce = saved_nonce
+        split_at = template.rindex(canonical_json(placeholder))
+        return template[:split_at], template[split_at + len(placeholder) + 2:]
+
+    def generate_hash(self):
+        # Creates a unique hash for this block
+        # All block information is combined to make the hash
+        return hashlib.sha256(self.generate_content()).digest()
 
 # Main blockchain class
 class SecureChain:
@@ -39,11 +122,14 @@ class SecureChain:
     def __init__(self):
         self.blocks = [self.initialize_genesis()]   # Start with first block
         self.mining_complexity = 3                  # Difficulty level for mining
+        self.verbose = False                        # Log progress while mining
+        self.total_nonces = 0                       # Mining attempts over all blocks
+        self.validated_through = 0                  # Last block verified so far
 
     def initialize_genesis(self):
         # Creates the first block in the blockchain
         # This block has no previous block to reference
-        return CryptoBlock(0, "0x0", time.time(), "Genesis Block - First block created", 0)
+        return CryptoBlock(0, bytes(32), time.time_ns(), "Genesis Block - First block created", 0)
 
     def fetch_last_block(self):
         # Returns the most recent block in the chain
@@ -52,26 +138,73 @@ class SecureChain:
     def mine_block(self, target_block):
         # Performs mining operation on a block
         # Mining finds a nonce that makes the hash start with zeros
-        target_block.nonce = 0
-        mining_target = "0" * self.mining_complexity
-        
-        print(f"Mining started with difficulty {self.mining_complexity}")
-        start_time = time.time()
-        
+        # Each leading zero hex digit is four leading zero bits of the raw
+        # digest, so a hash meets the difficulty exactly when the digest as
+        # a number is below this target
+        target = 1 << (256 - 4 * self.mining_complexity)
+
+        # Only the nonce changes between attempts, so serialize the block once
+        prefix, suffix = target_block.prepare_mining_template()
+
+        logger.info("Mining started with difficulty %d", self.mining_complexity)
+        start_time = time.perf_counter()
+
+        # Hard blocks take millions of attempts, so spread them over all
+        # CPU cores; easy blocks finish before worker processes would start
+        workers = os.cpu_count() or 1
+        if workers > 1 and self.mining_complexity >= PARALLEL_MINING_MIN_DIFFICULTY:
+            result = self.search_nonce_parallel(prefix, suffix, target, workers)
+        else:
+            result = self.search_nonce_serial(prefix, suffix, target)
+        target_block.nonce, target_block.current_hash = result
+
+        mining_time = time.perf_counter() - start_time
+        logger.info("Block mined successfully in %.2f seconds", mining_time)
+        logger.info("Final nonce value: %d", target_block.nonce)
+
+    def search_nonce_serial(self, prefix, suffix, target):
+        # Searches nonces 0, 1, 2, ... in this process
+        # Hash the fixed prefix once and reuse its state (the "midstate")
+        # for every attempt, so only the nonce and suffix are hashed per nonce
+        prefix_state = hashlib.sha256(prefix)
+        start_nonce = 0
         while True:
-            # Calculate new hash with current nonce
-            target_block.current_hash = target_block.generate_hash()
-            # Check if hash meets the difficulty requirement
-            if target_block.current_hash.startswith(mining_target):
-                mining_time = time.time() - start_time
-                print(f"Block mined successfully in {mining_time:.2f} seconds")
-                print(f"Final nonce value: {target_block.nonce}")
-                break
-            target_block.nonce += 1
-            
-            # Show progress every 5000 attempts
-            if target_block.nonce % 5000 == 0:
-                print(f"Mining in progress... attempts made: {target_block.nonce}")
+            # Test a whole batch of nonces before coming back to the loop
+            result = search_nonce_batch(prefix_state, suffix, start_nonce,
+                                        MINING_BATCH_SIZE, target)
+            if result is not None:
+                return result
+            start_nonce += MINING_BATCH_SIZE
+
+            # Show progress after every batch of attempts
+            if self.verbose:
+                logger.info("Mining in progress... attempts made: %d", start_nonce)
+
+    def search_nonce_parallel(self, prefix, suffix, target, workers):
+        """
+        Searches nonces across several processes.
+        Worker i tests base + i, base + i + workers, ... so workers never
+        overlap, and each round covers the next workers * MINING_BATCH_SIZE
+        nonces. The lowest winning nonce of a round is returned, which is
+        the same nonce a serial search would find.
+        """
+        base_nonce = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            while True:
+                futures = [
+                    executor.submit(search_nonce_worker, prefix, suffix, base_nonce + i,
+                                    MINING_BATCH_SIZE, target, workers)
+                    for i in range(workers)
+                ]
+                results = [future.result() for future in futures]
+                found = [result for result in results if result is not None]
+                if found:
+                    return min(found)
+                base_nonce += workers * MINING_BATCH_SIZE
+
+                # Show progress after every round of attempts
+                if self.verbose:
+                    logger.info("Mining in progress... attempts made: %d", base_nonce)
 
     def append_new_block(self, user_data):
         """
@@ -84,27 +217,64 @@ class SecureChain:
         new_crypto_block = CryptoBlock(
             block_id=len(self.blocks),
             prev_block_hash=last_block_hash,
-            created_time=time.time(),
+            created_time=time.time_ns(),
             block_data=user_data,
             nonce=0
         )
         self.mine_block(new_crypto_block)           # Mine the block
         self.blocks.append(new_crypto_block)        # Add to chain
+        self.total_nonces += new_crypto_block.nonce  # Add its mining work
 
-    def validate_integrity(self):
+    def validate_integrity(self, incremental=False):
         """
         Checks if the blockchain is valid and not tampered with.
         Verifies all hashes and block connections.
+        With incremental=True only blocks added since the last successful
+        check are verified; call invalidate() to force a full check again.
         """
         print("Checking blockchain integrity...")
-        
-        # Check each block starting from second block
-        for i in range(1, len(self.blocks)):
+
+        # Check each block starting from second block, or from the first
+        # block that has not been verified yet
+        first = self.validated_through + 1 if incremental else 1
+        checked_blocks = self.blocks[first:]
+
+        # Every block's hash depends only on its own fields, so all of them
+        # can be recomputed up front. A block with a malformed previous hash
+        # cannot be hashed; it is reported as a broken link further down.
+        recomputed_hashes = [
+            block.generate_hash() if is_raw_hash(block.prev_block_hash) else None
+            for block in checked_blocks
+        ]
+
+        # Lay the stored, recomputed and linked hashes out as contiguous
+        # byte strings, so a valid chain is confirmed by two memory compares.
+        # This only holds if every hash is exactly 32 bytes; otherwise hash
+        # boundaries could shift, so leave it to the per-block checks below.
+        stored_list = [block.current_hash for block in self.blocks[first-1:]]
+        linked_list = [block.prev_block_hash for block in checked_blocks]
+        if (all(is_raw_hash(h) for h in stored_list)
+                and all(is_raw_hash(h) for h in linked_list)
+                and b"".join(stored_list[1:]) == b"".join(recomputed_hashes)
+                and b"".join(stored_list[:-1]) == b"".join(linked_list)):
+            self.validated_through = len(self.blocks) - 1
+            print("Blockchain integrity verified successfully")
+            return True
+
+        # Something is wrong: check each block in turn to report the first
+        # one that fails
+        self.validated_through = 0
+        for i in range(first, len(self.blocks)):
             current_block = self.blocks[i]
             previous_block = self.blocks[i-1]
 
+            # A block whose previous hash is not a raw hash cannot link up
+            if not is_raw_hash(current_block.prev_block_hash):
+                print(f"Block {current_block.block_id}: Previous hash link is broken!")
+                return False
+
             # Verify the stored hash matches calculated hash
-            if current_block.current_hash != current_block.generate_hash():
+            if current_block.current_hash != recomputed_hashes[i-first]:
                 print(f"Block {current_block.block_id}: Hash does not match!")
                 return False
             
@@ -113,24 +283,32 @@ class SecureChain:
                 print(f"Block {current_block.block_id}: Previous hash link is broken!")
                 return False
 
+        self.validated_through = len(self.blocks) - 1
         print("Blockchain integrity verified successfully")
         return True
 
+    def invalidate(self):
+        # Forgets earlier checks, e.g. after blocks were changed directly,
+        # so the next incremental check verifies the whole chain again
+        self.validated_through = 0
+
     def display_chain_stats(self):
         """
         Shows information about the blockchain.
         Includes block count, difficulty, and validity status.
+        Only blocks added since the last successful check are re-verified.
         """
         print(f"\nBlockchain Information:")
         print(f"  Total blocks: {len(self.blocks)}")
         print(f"  Mining difficulty: {self.mining_complexity}")
-        print(f"  Chain status: {'Valid' if self.validate_integrity() else 'Invalid'}")
-        # Calculate total mining work done
-        total_nonces = sum(block.nonce for block in self.blocks)
-        print(f"  Total mining attempts: {total_nonces}")
+        print(f"  Chain status: {'Valid' if self.validate_integrity(incremental=True) else 'Invalid'}")
+        # Total mining work done is kept up to date as blocks are added
+        print(f"  Total mining attempts: {self.total_nonces}")
 
 # Main program interface
 if __name__ == "__main__":
+    # Show mining start and finish messages in the console
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     my_blockchain = SecureChain()
     
     print("Blockchain System Started")
@@ -159,11 +337,11 @@ if __name__ == "__main__":
             print("-" * 60)
             for block in my_blockchain.blocks:
                 print(f"Block #{block.block_id}")
-                print(f"  Created: {time.ctime(block.created_time)}")
+                print(f"  Created: {time.ctime(block.created_time / 1e9)}")
                 print(f"  Data: {block.block_data}")
                 print(f"  Nonce: {block.nonce}")
-                print(f"  Previous Hash: {block.prev_block_hash}")
-                print(f"  Current Hash: {block.current_hash}")
+                print(f"  Previous Hash: {block.prev_block_hash.hex()}")
+                print(f"  Current Hash: {block.current_hash.hex()}")
                 print("-" * 60)
                 
         elif user_choice == "3":